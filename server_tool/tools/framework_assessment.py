@@ -17,28 +17,142 @@ Game Server Framework Completeness Assessment Tool
 
 import os
 import sys
+import shutil
+import argparse
+import csv
 import json
+import re
 import time
+import hashlib
+import functools
 import subprocess
 import threading
 from pathlib import Path
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Tuple, Any
+from collections import deque
+from xml.etree import ElementTree
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Tuple, Any, NamedTuple, FrozenSet, get_origin
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+import logging.handlers
 
-# 配置日志
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖，缺失时回退到标准库json
+    orjson = None
+
+# 配置日志（文件日志先缓冲在内存中，遇到ERROR或评估结束时批量写入）
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+log_file_handler = logging.FileHandler('/tmp/framework_assessment.log')
+log_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_buffer = logging.handlers.MemoryHandler(1024, flushLevel=logging.ERROR, target=log_file_handler)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler('/tmp/framework_assessment.log'),
+        log_buffer,
         logging.StreamHandler(sys.stdout)
     ]
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+TOOL_VERSION = "1.1.0"
+
+# 报告输出路径
+REPORT_JSON_FILE = "/tmp/framework_assessment_report.json"
+REPORT_MD_FILE = "/tmp/framework_assessment_report.md"
+
+# 回放缓存目录（按输入指纹保存历史报告）
+REPLAY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "game-server-framework-assess")
+REPLAY_EXPIRES_FILE = "expires_at"
+
+# 遍历目录时跳过的构建产物、VCS和IDE目录
+PRUNED_DIRS = frozenset({"target", ".git", "node_modules", "build", ".idea", "out"})
+SRC_SEGMENT = os.sep + "src" + os.sep
+
+# 编译结果缓存（按源码指纹索引，24小时过期）
+COMPILE_CACHE_FILE = "/tmp/framework_assessment_cache.json"
+COMPILE_CACHE_TTL = 24 * 3600
+# 未统计覆盖率（如JaCoCo插件不可用、测试超时）的结果只缓存1小时，之后重新尝试统计
+COVERAGE_RETRY_TTL = 3600
+MAIN_JAVA_SEGMENT = os.sep + os.path.join("src", "main", "java") + os.sep
+# 构建同时编译并运行测试，测试源码和测试资源也参与指纹
+TEST_SEGMENT = os.sep + os.path.join("src", "test") + os.sep
+
+# 一次Maven调用完成编译、测试和JaCoCo覆盖率报告，测试失败不影响编译结论
+JACOCO_PLUGIN = "org.jacoco:jacoco-maven-plugin:0.8.12"
+MAVEN_GOALS = [f"{JACOCO_PLUGIN}:prepare-agent", "test", f"{JACOCO_PLUGIN}:report"]
+# JaCoCo插件无法解析（如离线且本地仓库没有）或测试运行超时时只编译，不统计覆盖率
+FALLBACK_GOALS = ["test-compile"]
+MAVEN_TIMEOUT = 600
+FALLBACK_TIMEOUT = 300
+COVERAGE_UNAVAILABLE = "JaCoCo插件不可用，未统计覆盖率"
+COVERAGE_TIMEOUT = "测试运行超时，未统计覆盖率"
+JACOCO_CSV = os.path.join("target", "site", "jacoco", "jacoco.csv")
+JACOCO_EXEC = os.path.join("target", "jacoco.exec")
+
+# 只有编译器插件的失败才算编译失败；这些目标在编译之后执行，失败说明编译已完成
+COMPILER_PLUGIN = "maven-compiler-plugin"
+POST_COMPILE_GOALS = frozenset({"test", "report"})
+_FAIL_RE = re.compile(
+    r"^\[ERROR\] Failed to execute goal (\S+?):(\w+) (?:\(.*?\) )?on project (\S+?):", re.M
+)
+# 反应堆摘要位于"Reactor Summary"标题和其后的分隔线之间；名称超过52字符时不补点，只隔一个空格
+_REACTOR_SUMMARY_RE = re.compile(r"Reactor Summary.*?$(?P<body>.*?)^\[INFO\] -{10,}", re.M | re.S)
+_REACTOR_RE = re.compile(
+    r"^\[INFO\] (?P<name>.+?) (?:\.+ )?(?P<state>SUCCESS|FAILURE|SKIPPED)\b", re.M
+)
+_JACOCO_UNRESOLVED_RE = re.compile(
+    r"Plugin org\.jacoco:jacoco-maven-plugin:\S+ or one of its dependencies could not be resolved"
+)
+
+@functools.lru_cache(maxsize=256)
+def _dir_snapshot(path_str: str) -> Optional[FrozenSet[str]]:
+    """缓存目录的子项名称集合，目录不存在或不可读时返回None（空目录返回空集合）"""
+    try:
+        return frozenset(os.listdir(path_str))
+    except OSError:
+        return None
+
+def _shallow(obj) -> Dict[str, Any]:
+    """浅转换dataclass为字典（不像asdict那样递归深拷贝，列表字段直接引用）"""
+    return {field.name: getattr(obj, field.name) for field in fields(obj)}
+
+# 性能基准测试项: (测试名称, 目标值, 单位, 说明)，实际值待实现真实测试后填充
+_PERF_STUBS = (
+    ("Actor消息处理吞吐量", 1_000_000, "msg/s", "需要实现Actor系统性能测试"),  # 100万msg/s
+    ("Actor并发数量", 100_000, "actors", "需要实现Actor并发测试"),  # 10万并发Actor
+    ("网络延迟99分位", 10, "ms", "需要实现网络性能测试"),  # <10ms
+    ("RPC调用延迟", 1, "ms", "需要实现RPC性能测试"),  # <1ms
+    ("数据库操作TPS", 100_000, "ops/s", "需要实现数据库性能测试"),  # 10万ops/s
+)
+
+# 报告中的状态图标（按bool下标取值）和模块表格行模板
+BOOL_ICON = ("❌", "✅")
+ROW_TMPL = "| {0} | {1} | {2} | {3} | {4} | {5:.1f}% | {6} |\n".format
+
+def _scandir_recursive(root: str, prune: frozenset = PRUNED_DIRS):
+    """广度优先遍历目录树并产出DirEntry，跳过prune中的目录且不跟随符号链接
+
+    src目录内不做裁剪，避免名为build、out等的Java包被跳过。
+    DirEntry的is_dir()/is_file()直接使用getdents返回的类型信息，无需额外stat。
+    """
+    root_len = len(root.rstrip(os.sep))
+    pending = deque([root])
+    while pending:
+        try:
+            with os.scandir(pending.popleft()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in prune and SRC_SEGMENT not in entry.path[root_len:]:
+                    continue
+                pending.append(entry.path)
+            yield entry
+
+@dataclass(slots=True, frozen=False)
 class ModuleStatus:
     """模块状态"""
     name: str
@@ -54,7 +168,7 @@ class ModuleStatus:
         if self.issues is None:
             self.issues = []
 
-@dataclass 
+@dataclass(slots=True, frozen=False)
 class PerformanceMetrics:
     """性能指标"""
     test_name: str
@@ -64,6 +178,47 @@ class PerformanceMetrics:
     passed: bool
     details: str = ""
 
+class BuildOutcome(NamedTuple):
+    """Maven构建输出的解析结果"""
+    success: bool                     # Maven返回码为0
+    states: Dict[str, str]            # 反应堆摘要: 项目名称 -> SUCCESS/FAILURE/SKIPPED
+    compile_failed: List[str]         # 编译器插件(compile/testCompile)失败的artifactId
+    post_compile_failed: List[str]    # 编译之后的目标(测试/覆盖率报告)失败的artifactId
+    coverage_failed: List[str]        # JaCoCo目标失败的artifactId
+    coverage_skipped: str             # 本次构建未统计覆盖率的原因，统计了覆盖率时为空
+    coverage: Dict[str, float]        # 构建后读取的模块指令覆盖率: 相对框架根目录的模块路径 -> 百分比
+    
+    @property
+    def reusable(self) -> bool:
+        """编译结论是否只由源码决定：构建成功或定位到了编译失败的模块，环境问题导致的失败不算"""
+        return self.success or bool(self.compile_failed)
+    
+    @property
+    def ttl(self) -> int:
+        """缓存有效期：未统计覆盖率时较短，以便环境恢复后重新统计"""
+        return COVERAGE_RETRY_TTL if self.coverage_skipped else COMPILE_CACHE_TTL
+
+def _valid_cache_entry(value: Any) -> bool:
+    """校验编译缓存条目: {"timestamp": 数值, "outcome": 与BuildOutcome字段及类型一致的字典}"""
+    if not isinstance(value, dict):
+        return False
+    timestamp, outcome = value.get("timestamp"), value.get("outcome")
+    if isinstance(timestamp, bool) or not isinstance(timestamp, (int, float)):
+        return False
+    if not isinstance(outcome, dict) or set(outcome) != set(BuildOutcome._fields):
+        return False
+    return all(isinstance(outcome[name], get_origin(field_type) or field_type)
+               for name, field_type in BuildOutcome.__annotations__.items())
+
+class ModuleTally(NamedTuple):
+    """模块统计（一次遍历得到的各项计数）"""
+    total: int
+    exists: int
+    with_pom: int
+    compilable: int
+    with_tests: int
+    coverage_sum: float
+
 @dataclass
 class AssessmentResult:
     """评估结果"""
@@ -75,12 +230,14 @@ class AssessmentResult:
     overall_score: float
     recommendations: List[str]
     timestamp: str
+    compilation_success: bool = False
 
 class FrameworkAssessment:
     """框架评估工具"""
     
-    def __init__(self, framework_root: str):
+    def __init__(self, framework_root: str, offline: bool = False):
         self.framework_root = Path(framework_root)
+        self.offline = offline
         self.result = AssessmentResult(
             framework_modules={},
             business_modules={},
@@ -92,6 +249,18 @@ class FrameworkAssessment:
             timestamp=time.strftime('%Y-%m-%d %H:%M:%S')
         )
         
+        # 所有模块的扁平列表，在模块完整性检查结束时构建
+        self._all_modules: List[ModuleStatus] = []
+        
+        # 构建阶段得到的模块覆盖率问题（模块路径 -> 问题描述）和覆盖率（随编译结果一起缓存）
+        self._coverage_issues: Dict[str, str] = {}
+        self._build_coverage: Dict[str, float] = {}
+        
+        # 编译检查是否得到了只由源码决定的结论、评估是否正常完成，决定报告能否进入回放缓存
+        self._build_verified = False
+        self._report_ttl: Optional[int] = None
+        self._assessment_completed = False
+        
         # 定义预期的模块结构
         self.expected_framework_modules = [
             "common", "network", "rpc", "cache", "database", 
@@ -111,6 +280,7 @@ class FrameworkAssessment:
     def run_assessment(self) -> AssessmentResult:
         """运行完整评估"""
         logger.info("开始框架完整性评估...")
+        _dir_snapshot.cache_clear()
         
         try:
             # Phase 1: 模块完整性检查
@@ -132,10 +302,13 @@ class FrameworkAssessment:
             self._calculate_score_and_recommendations()
             
             logger.info(f"评估完成，总体得分: {self.result.overall_score:.1f}%")
+            self._assessment_completed = True
+            log_buffer.flush()
             
         except Exception as e:
             logger.error(f"评估过程中出现错误: {e}")
             self.result.recommendations.append(f"评估过程出现错误: {str(e)}")
+            log_buffer.flush()
             
         return self.result
     
@@ -143,48 +316,61 @@ class FrameworkAssessment:
         """检查模块完整性"""
         logger.info("检查模块完整性...")
         
-        # 检查框架模块
-        self._check_modules("frame", self.expected_framework_modules, "framework_modules")
+        # 框架模块、业务模块和支撑模块(launcher, common)互不依赖，并发分析
+        root = os.fspath(self.framework_root)
+        modules_to_check = (
+            [("framework_modules", name, os.path.join(root, "frame", f"frame-{name}"))
+             for name in self.expected_framework_modules] +
+            [("business_modules", name, os.path.join(root, "business", name))
+             for name in self.expected_business_modules] +
+            [("support_modules", name, os.path.join(root, name))
+             for name in ("launcher", "common")]
+        )
         
-        # 检查业务模块  
-        self._check_modules("business", self.expected_business_modules, "business_modules")
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [(result_key, name, executor.submit(self._analyze_module, name, path))
+                       for result_key, name, path in modules_to_check]
+            
+            # 按提交顺序收集结果，保证报告中的模块顺序稳定
+            for result_key, name, future in futures:
+                getattr(self.result, result_key)[name] = future.result()
         
-        # 检查支撑模块
+        # 检查测试框架和后台管理控制台
         self._check_support_modules()
-    
-    def _check_modules(self, base_dir: str, expected_modules: List[str], result_key: str):
-        """检查指定目录下的模块"""
-        modules_dict = getattr(self.result, result_key)
         
-        for module_name in expected_modules:
-            if base_dir == "frame":
-                module_path = self.framework_root / base_dir / f"frame-{module_name}"
-            else:
-                module_path = self.framework_root / base_dir / module_name
-                
-            status = self._analyze_module(module_name, module_path)
-            modules_dict[module_name] = status
+        self._collect_modules()
+    
+    def _collect_modules(self):
+        """汇总三类模块为扁平列表，并使依赖它的缓存失效"""
+        self._all_modules = [
+            *self.result.framework_modules.values(),
+            *self.result.business_modules.values(),
+            *self.result.support_modules.values()
+        ]
+        self.__dict__.pop("pom_modules", None)
+    
+    @functools.cached_property
+    def pom_modules(self) -> List[ModuleStatus]:
+        """目录存在且有pom.xml的模块"""
+        return [m for m in self._all_modules if m.exists and m.has_pom]
     
     def _check_support_modules(self):
         """检查支撑模块"""
-        # launcher
-        launcher_path = self.framework_root / "launcher"
-        self.result.support_modules["launcher"] = self._analyze_module("launcher", launcher_path)
-        
-        # common (作为通用支撑)
-        common_path = self.framework_root / "common"  
-        self.result.support_modules["common"] = self._analyze_module("common", common_path)
-        
         # 检查是否有测试框架
         test_framework_exists = False
         admin_console_exists = False
         
-        # 在各个模块中寻找测试相关内容
-        for root, dirs, files in os.walk(self.framework_root):
-            if "test-framework" in str(root).lower() or "testing" in str(root).lower():
+        # 在各个模块中寻找测试相关目录（跳过构建产物和VCS目录，两者都找到后立即停止）
+        for entry in _scandir_recursive(os.fspath(self.framework_root)):
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            name = entry.name.lower()
+            if "test-framework" in name or "testing" in name:
                 test_framework_exists = True
-            if "admin" in str(root).lower() and "console" in str(root).lower():
+            if "admin" in name and "console" in name:
                 admin_console_exists = True
+            if test_framework_exists and admin_console_exists:
+                break
         
         self.result.support_modules["test-framework"] = ModuleStatus(
             name="test-framework",
@@ -200,163 +386,302 @@ class FrameworkAssessment:
             issues=[] if admin_console_exists else ["后台管理控制台缺失"]
         )
     
-    def _analyze_module(self, name: str, path: Path) -> ModuleStatus:
-        """分析单个模块"""
-        status = ModuleStatus(name=name, path=str(path))
-        
-        # 检查模块是否存在
-        status.exists = path.exists() and path.is_dir()
-        if not status.exists:
+    def _analyze_module(self, name: str, path: str) -> ModuleStatus:
+        """分析单个模块（不修改实例状态，可在线程池中并发调用）"""
+        base = os.fspath(path)
+        status = ModuleStatus(name=name, path=base)
+        
+        # 检查模块是否存在（一次目录快照同时得到存在性和子项列表）
+        children = _dir_snapshot(base)
+        if children is None:
             status.issues.append("模块目录不存在")
             return status
+        status.exists = True
         
         # 检查是否有pom.xml
-        pom_file = path / "pom.xml"
-        status.has_pom = pom_file.exists()
+        status.has_pom = "pom.xml" in children
         if not status.has_pom:
             status.issues.append("缺少pom.xml文件")
         
         # 检查源码结构
-        src_main = path / "src" / "main" / "java"
-        if not src_main.exists():
+        src_main = _dir_snapshot(os.path.join(base, "src", "main")) if "src" in children else None
+        if not (src_main and "java" in src_main):
             status.issues.append("缺少标准Maven源码结构")
         
         # 检查测试代码
-        src_test = path / "src" / "test" / "java"
-        status.has_tests = src_test.exists()
+        src_test = _dir_snapshot(os.path.join(base, "src", "test")) if "src" in children else None
+        status.has_tests = bool(src_test) and "java" in src_test
         if not status.has_tests:
             status.issues.append("缺少测试代码")
         
         return status
     
     def _check_compilation(self):
-        """检查编译状态"""
+        """检查编译状态
+
+        使用Maven 3并行构建(-T 1C，每核一个线程)按reactor依赖图并发构建各模块，
+        编译、测试和JaCoCo报告合并为一次调用，只需一次JVM启动；覆盖率由
+        _check_test_coverage从各模块生成的jacoco.csv读取。
+        模块只有在反应堆摘要中构建成功（或失败发生在编译之后的目标上）时才算可编译，
+        --fail-at-end跳过的下游模块不算。
+        """
         logger.info("检查项目编译状态...")
         
         try:
-            # 尝试编译项目
-            result = subprocess.run(
-                ["mvn", "clean", "compile", "-q"],
-                cwd=self.framework_root,
-                capture_output=True,
-                text=True,
-                timeout=300
-            )
-            
-            compilation_success = result.returncode == 0
+            # 源码未变化且缓存未过期时直接复用上次的编译结果
+            fingerprint = self._fingerprint()
+            cache = self._load_compile_cache()
+            cached = cache.get(fingerprint)
+            now = time.time()
             
-            # 更新模块编译状态
-            for modules_dict in [self.result.framework_modules, 
-                                self.result.business_modules, 
-                                self.result.support_modules]:
-                for module_status in modules_dict.values():
-                    if module_status.exists and module_status.has_pom:
-                        module_status.compilable = compilation_success
-                        if not compilation_success:
-                            module_status.issues.append("编译失败")
+            outcome = BuildOutcome(**cached["outcome"]) if cached else None
+            if outcome and now - cached["timestamp"] < outcome.ttl:
+                logger.info("源码未变化，复用缓存的编译结果")
+            else:
+                # 尝试构建项目（缓存存在时跳过clean以复用已有的target/classes，
+                # 但先删除上次的覆盖率数据，避免未重新测试的模块沿用旧报告）
+                if cache:
+                    self._clear_coverage_reports()
+                try:
+                    returncode, output = self._run_maven(MAVEN_GOALS, clean=not cache,
+                                                         timeout=MAVEN_TIMEOUT)
+                    coverage_skipped = COVERAGE_UNAVAILABLE if _JACOCO_UNRESOLVED_RE.search(output) else ""
+                except subprocess.TimeoutExpired:
+                    # 超时多半耗在测试上，不能因此判定编译失败
+                    coverage_skipped = COVERAGE_TIMEOUT
+                if coverage_skipped:
+                    logger.warning(f"{coverage_skipped}，改为只编译")
+                    returncode, output = self._run_maven(FALLBACK_GOALS, clean=False,
+                                                         timeout=FALLBACK_TIMEOUT)
+                
+                # 覆盖率在构建后立即读取并随结果缓存，命中缓存时不依赖target/下的文件是否还在
+                outcome = self._parse_build_output(returncode, output, coverage_skipped)
+                if not coverage_skipped:
+                    outcome = outcome._replace(coverage=self._collect_coverage())
+                if not outcome.success:
+                    logger.warning(f"构建失败，编译失败模块: {', '.join(outcome.compile_failed) or '-'}")
+                
+                # 依赖/插件解析失败等环境问题修复后应重新构建，不缓存
+                if outcome.reusable:
+                    cache = {key: value for key, value in cache.items()
+                             if now - value["timestamp"] < BuildOutcome(**value["outcome"]).ttl}
+                    cache[fingerprint] = {"timestamp": now, "outcome": outcome._asdict()}
+                    self._save_compile_cache(cache)
             
-            if not compilation_success:
-                logger.warning(f"编译失败: {result.stderr}")
+            self.result.compilation_success = self._apply_build_outcome(outcome)
+            self._build_coverage = outcome.coverage
+            self._build_verified = outcome.reusable
+            self._report_ttl = None if outcome.ttl == COMPILE_CACHE_TTL else outcome.ttl
                 
         except subprocess.TimeoutExpired:
             logger.error("编译超时")
+            for module_status in self.pom_modules:
+                module_status.issues.append("编译检查超时")
         except Exception as e:
             logger.error(f"编译检查出错: {e}")
     
+    def _clear_coverage_reports(self):
+        """删除各模块上次构建留下的jacoco.exec和jacoco.csv"""
+        for module_status in self.pom_modules:
+            for report in (JACOCO_EXEC, JACOCO_CSV):
+                try:
+                    os.remove(os.path.join(module_status.path, report))
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.warning(f"删除旧覆盖率数据失败: {e}")
+    
+    def _collect_coverage(self) -> Dict[str, float]:
+        """读取各模块本次构建生成的jacoco.csv"""
+        coverage = {}
+        for module_status in self.pom_modules:
+            module_coverage = self._read_jacoco_coverage(module_status.path)
+            if module_coverage is not None:
+                coverage[self._module_key(module_status)] = module_coverage
+        return coverage
+    
+    def _module_key(self, module_status: ModuleStatus) -> str:
+        """模块相对框架根目录的路径，用作缓存中的模块键"""
+        return os.path.relpath(module_status.path, self.framework_root)
+    
+    def _run_maven(self, goals: List[str], clean: bool, timeout: int) -> Tuple[int, str]:
+        """执行Maven构建，返回(返回码, 合并后的输出)"""
+        mvn_args = ["mvn", "-B", "-T", "1C", "-o" if self.offline else None,
+                    "clean" if clean else None, *goals,
+                    "--fail-at-end", "-Dmaven.test.failure.ignore=true"]
+        # 在用户已有的MAVEN_OPTS（代理、本地仓库等设置）之后追加GC和堆参数
+        maven_opts = f"{os.environ.get('MAVEN_OPTS', '')} -XX:+UseParallelGC -Xmx2g".strip()
+        env = dict(os.environ, MAVEN_OPTS=maven_opts)
+        result = subprocess.run(
+            [arg for arg in mvn_args if arg is not None],
+            cwd=self.framework_root,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env=env
+        )
+        return result.returncode, result.stdout + result.stderr
+    
+    def _parse_build_output(self, returncode: int, output: str,
+                            coverage_skipped: str = "") -> BuildOutcome:
+        """从Maven输出中解析反应堆摘要和各模块失败的目标"""
+        compile_failed, post_compile_failed, coverage_failed = set(), set(), set()
+        for match in _FAIL_RE.finditer(output):
+            plugin, goal, project = match.groups()
+            if COMPILER_PLUGIN in plugin:
+                compile_failed.add(project)
+                continue
+            if goal in POST_COMPILE_GOALS:
+                post_compile_failed.add(project)
+            if "jacoco" in plugin:
+                coverage_failed.add(project)
+        
+        summary = _REACTOR_SUMMARY_RE.search(output)
+        states = {match.group("name"): match.group("state")
+                  for match in _REACTOR_RE.finditer(summary.group("body"))} if summary else {}
+        
+        return BuildOutcome(
+            success=returncode == 0,
+            states=states,
+            compile_failed=sorted(compile_failed),
+            post_compile_failed=sorted(post_compile_failed),
+            coverage_failed=sorted(coverage_failed),
+            coverage_skipped=coverage_skipped,
+            coverage={}
+        )
+    
+    def _apply_build_outcome(self, outcome: BuildOutcome) -> bool:
+        """根据构建结果更新模块编译状态，返回是否所有有pom.xml的模块都编译通过"""
+        self._coverage_issues = {}
+        
+        # 没有反应堆摘要（构建未启动或单模块构建）时只能依据返回码整体判断，
+        # 失败时记录在评估结果上，不逐个给模块添加问题
+        if not outcome.states:
+            for module_status in self.pom_modules:
+                module_status.compilable = outcome.success
+                if outcome.coverage_skipped:
+                    self._coverage_issues[module_status.path] = outcome.coverage_skipped
+            return outcome.success and bool(self.pom_modules)
+        
+        compile_failed = set(outcome.compile_failed)
+        post_compile_failed = set(outcome.post_compile_failed)
+        coverage_failed = set(outcome.coverage_failed)
+        
+        for module_status in self.pom_modules:
+            artifact_id, name = self._pom_identity(module_status)
+            state = outcome.states.get(name) or outcome.states.get(artifact_id)
+            
+            if artifact_id in compile_failed:
+                issue = "编译失败"
+            elif state == "SUCCESS" or (state == "FAILURE" and artifact_id in post_compile_failed):
+                issue = None
+            elif state == "SKIPPED":
+                issue = "依赖模块构建失败，未编译"
+            elif state == "FAILURE":
+                issue = "构建在编译之前失败"
+            else:
+                issue = "未参与Maven构建"
+            
+            module_status.compilable = issue is None
+            if issue is not None:
+                module_status.issues.append(issue)
+            
+            if outcome.coverage_skipped:
+                self._coverage_issues[module_status.path] = outcome.coverage_skipped
+            elif artifact_id in coverage_failed:
+                self._coverage_issues[module_status.path] = "JaCoCo覆盖率报告生成失败"
+        
+        # 未参与Maven构建的模块（如在根pom中被注释掉）同样视为未编译通过
+        return bool(self.pom_modules) and all(m.compilable for m in self.pom_modules)
+    
+    def _pom_identity(self, module_status: ModuleStatus) -> Tuple[str, str]:
+        """读取模块pom.xml中的(artifactId, name)，name缺省时与artifactId相同"""
+        try:
+            root = ElementTree.parse(os.path.join(module_status.path, "pom.xml")).getroot()
+            artifact_id = root.findtext("{*}artifactId") or root.findtext("artifactId")
+            name = root.findtext("{*}name") or root.findtext("name")
+        except (OSError, ElementTree.ParseError):
+            artifact_id = name = None
+        artifact_id = artifact_id or os.path.basename(module_status.path)
+        return artifact_id, (name or artifact_id).strip()
+    
+    def _fingerprint(self) -> str:
+        """计算pom.xml、src/main/java下Java源文件及src/test下所有文件的(路径, mtime, 大小)指纹"""
+        folded = 0
+        for entry in _scandir_recursive(os.fspath(self.framework_root.resolve())):
+            if not (entry.name == "pom.xml"
+                    or (entry.name.endswith(".java") and MAIN_JAVA_SEGMENT in entry.path)
+                    or TEST_SEGMENT in entry.path):
+                continue
+            try:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            digest = hashlib.blake2b(
+                f"{entry.path}:{st.st_mtime_ns}:{st.st_size}".encode("utf-8"),
+                digest_size=16
+            ).digest()
+            folded ^= int.from_bytes(digest, "big")
+        return f"{folded:032x}"
+    
+    def _load_compile_cache(self) -> Dict[str, Dict[str, Any]]:
+        """读取编译结果缓存，格式为 {指纹: {"timestamp": 时间戳, "outcome": BuildOutcome字段}}"""
+        try:
+            with open(COMPILE_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        return {key: value for key, value in cache.items() if _valid_cache_entry(value)}
+    
+    def _save_compile_cache(self, cache: Dict[str, Dict[str, Any]]):
+        """写入编译结果缓存"""
+        try:
+            with open(COMPILE_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(cache, f)
+        except OSError as e:
+            logger.warning(f"写入编译缓存失败: {e}")
+    
     def _check_test_coverage(self):
         """检查测试覆盖率"""
         logger.info("检查测试覆盖率...")
         
-        # 这里可以集成JaCoCo或其他覆盖率工具
-        # 简化实现，基于测试文件数量估算
-        for modules_dict in [self.result.framework_modules, 
-                            self.result.business_modules, 
-                            self.result.support_modules]:
-            for module_status in modules_dict.values():
-                if module_status.has_tests:
-                    # 简单估算覆盖率
-                    module_status.test_coverage = 60.0  # 假设有测试的模块有60%覆盖率
-                else:
-                    module_status.test_coverage = 0.0
+        # 使用编译阶段由JaCoCo统计的覆盖率（只采用本次构建编译通过的模块）
+        for module_status in self._all_modules:
+            coverage = self._build_coverage.get(self._module_key(module_status)) if module_status.compilable else None
+            if coverage is None:
+                module_status.test_coverage = 0.0
+                issue = self._coverage_issues.get(module_status.path)
+                if issue is None and module_status.has_tests and module_status.compilable:
+                    issue = "缺少JaCoCo覆盖率报告"
+                if issue is not None:
+                    module_status.issues.append(issue)
+            else:
+                module_status.test_coverage = coverage
+    
+    def _read_jacoco_coverage(self, module_path: str) -> Optional[float]:
+        """从jacoco.csv汇总模块的指令覆盖率，报告不存在时返回None"""
+        try:
+            with open(os.path.join(module_path, JACOCO_CSV), 'r', encoding='utf-8', newline='') as f:
+                rows = list(csv.DictReader(f))
+            missed = sum(int(row["INSTRUCTION_MISSED"]) for row in rows)
+            covered = sum(int(row["INSTRUCTION_COVERED"]) for row in rows)
+        except (OSError, KeyError, ValueError):
+            return None
+        total = missed + covered
+        return (covered / total * 100) if total > 0 else 0.0
     
     def _run_performance_tests(self):
         """运行性能基准测试"""
         logger.info("运行性能基准测试...")
         
-        # Actor模型性能测试
-        self._test_actor_performance()
-        
-        # 网络性能测试
-        self._test_network_performance()
-        
-        # RPC性能测试  
-        self._test_rpc_performance()
-        
-        # 数据库性能测试
-        self._test_database_performance()
-    
-    def _test_actor_performance(self):
-        """测试Actor模型性能"""
-        # 模拟测试结果（实际应该启动Actor系统进行测试）
-        self.result.performance_metrics.append(
-            PerformanceMetrics(
-                test_name="Actor消息处理吞吐量",
-                target_value=1000000,  # 100万msg/s
-                actual_value=0,  # 需要实际测试
-                unit="msg/s",
-                passed=False,
-                details="需要实现Actor系统性能测试"
-            )
-        )
-        
-        self.result.performance_metrics.append(
-            PerformanceMetrics(
-                test_name="Actor并发数量",
-                target_value=100000,  # 10万并发Actor
-                actual_value=0,
-                unit="actors",
-                passed=False,
-                details="需要实现Actor并发测试"
-            )
-        )
-    
-    def _test_network_performance(self):
-        """测试网络性能"""
-        self.result.performance_metrics.append(
-            PerformanceMetrics(
-                test_name="网络延迟99分位",
-                target_value=10,  # <10ms
-                actual_value=0,
-                unit="ms",
-                passed=False,
-                details="需要实现网络性能测试"
-            )
-        )
-    
-    def _test_rpc_performance(self):
-        """测试RPC性能"""
-        self.result.performance_metrics.append(
-            PerformanceMetrics(
-                test_name="RPC调用延迟",
-                target_value=1,  # <1ms
-                actual_value=0,
-                unit="ms", 
-                passed=False,
-                details="需要实现RPC性能测试"
-            )
-        )
-    
-    def _test_database_performance(self):
-        """测试数据库性能"""
-        self.result.performance_metrics.append(
-            PerformanceMetrics(
-                test_name="数据库操作TPS",
-                target_value=100000,  # 10万ops/s
-                actual_value=0,
-                unit="ops/s",
-                passed=False,
-                details="需要实现数据库性能测试"
-            )
+        # 模拟测试结果（实际应该启动对应系统进行测试）
+        self.result.performance_metrics.extend(
+            PerformanceMetrics(name, target, 0, unit, False, details)
+            for name, target, unit, details in _PERF_STUBS
         )
     
     def _run_integration_tests(self):
@@ -386,17 +711,18 @@ class FrameworkAssessment:
         
         scores = []
         recommendations = []
+        tally = self._tally()
         
         # 1. 模块完整性得分 (30%)
-        module_score = self._calculate_module_score()
+        module_score = self._calculate_module_score(tally)
         scores.append(module_score * 0.3)
         
         # 2. 编译和构建得分 (20%)
-        build_score = self._calculate_build_score()
+        build_score = self._calculate_build_score(tally)
         scores.append(build_score * 0.2)
         
         # 3. 测试覆盖率得分 (20%)
-        test_score = self._calculate_test_score()
+        test_score = self._calculate_test_score(tally)
         scores.append(test_score * 0.2)
         
         # 4. 性能测试得分 (15%)
@@ -423,51 +749,41 @@ class FrameworkAssessment:
             
         self.result.recommendations = recommendations
     
-    def _calculate_module_score(self) -> float:
+    def _tally(self) -> ModuleTally:
+        """一次遍历所有模块，同时累计各项得分所需的计数"""
+        total = exists = with_pom = compilable = with_tests = 0
+        coverage_sum = 0.0
+        
+        for module_status in self._all_modules:
+            total += 1
+            if not module_status.exists:
+                continue
+            exists += 1
+            coverage_sum += module_status.test_coverage
+            if module_status.has_tests:
+                with_tests += 1
+            if module_status.has_pom:
+                with_pom += 1
+                if module_status.compilable:
+                    compilable += 1
+        
+        return ModuleTally(total, exists, with_pom, compilable, with_tests, coverage_sum)
+    
+    def _calculate_module_score(self, tally: ModuleTally) -> float:
         """计算模块完整性得分"""
-        total_modules = 0
-        working_modules = 0
-        
-        for modules_dict in [self.result.framework_modules, 
-                            self.result.business_modules, 
-                            self.result.support_modules]:
-            for module_status in modules_dict.values():
-                total_modules += 1
-                if module_status.exists and module_status.has_pom:
-                    working_modules += 1
-        
-        return (working_modules / total_modules * 100) if total_modules > 0 else 0
+        return (tally.with_pom / tally.total * 100) if tally.total > 0 else 0
     
-    def _calculate_build_score(self) -> float:
+    def _calculate_build_score(self, tally: ModuleTally) -> float:
         """计算构建得分"""
-        total_modules = 0
-        compilable_modules = 0
-        
-        for modules_dict in [self.result.framework_modules, 
-                            self.result.business_modules, 
-                            self.result.support_modules]:
-            for module_status in modules_dict.values():
-                if module_status.exists and module_status.has_pom:
-                    total_modules += 1
-                    if module_status.compilable:
-                        compilable_modules += 1
-        
-        return (compilable_modules / total_modules * 100) if total_modules > 0 else 0
+        if tally.with_pom == 0:
+            return 0
+        if self.result.compilation_success:
+            return 100.0
+        return tally.compilable / tally.with_pom * 100
     
-    def _calculate_test_score(self) -> float:
+    def _calculate_test_score(self, tally: ModuleTally) -> float:
         """计算测试得分"""
-        total_coverage = 0
-        module_count = 0
-        
-        for modules_dict in [self.result.framework_modules, 
-                            self.result.business_modules, 
-                            self.result.support_modules]:
-            for module_status in modules_dict.values():
-                if module_status.exists:
-                    total_coverage += module_status.test_coverage
-                    module_count += 1
-        
-        return (total_coverage / module_count) if module_count > 0 else 0
+        return (tally.coverage_sum / tally.exists) if tally.exists > 0 else 0
     
     def _calculate_performance_score(self) -> float:
         """计算性能得分"""
@@ -485,110 +801,204 @@ class FrameworkAssessment:
         passed_tests = sum(1 for passed in self.result.integration_tests.values() if passed)
         return (passed_tests / len(self.result.integration_tests) * 100)
     
-    def generate_report(self, output_file: str = "/tmp/framework_assessment_report.json"):
-        """生成评估报告"""
+    def generate_report(self, output_file: str = REPORT_JSON_FILE):
+        """生成评估报告（JSON和Markdown报告均只读取评估结果，并发生成）"""
         logger.info(f"生成评估报告: {output_file}")
         
-        # 转换为可序列化的格式
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            json_future = executor.submit(self._write_json, output_file)
+            md_future = executor.submit(self._generate_readable_report, REPORT_MD_FILE)
+            json_future.result()
+            md_future.result()
+    
+    def _write_json(self, output_file: str):
+        """写入JSON格式报告"""
+        # 转换为可序列化的格式（orjson可直接序列化dataclass，无需转换）
+        serialize = _shallow if orjson is None else (lambda obj: obj)
         report_data = {
             "assessment_summary": {
                 "timestamp": self.result.timestamp,
                 "overall_score": self.result.overall_score,
+                "compilation_success": self.result.compilation_success,
                 "recommendations": self.result.recommendations
             },
             "module_analysis": {
-                "framework_modules": {name: asdict(status) for name, status in self.result.framework_modules.items()},
-                "business_modules": {name: asdict(status) for name, status in self.result.business_modules.items()},
-                "support_modules": {name: asdict(status) for name, status in self.result.support_modules.items()}
+                "framework_modules": {name: serialize(status) for name, status in self.result.framework_modules.items()},
+                "business_modules": {name: serialize(status) for name, status in self.result.business_modules.items()},
+                "support_modules": {name: serialize(status) for name, status in self.result.support_modules.items()}
             },
-            "performance_metrics": [asdict(metric) for metric in self.result.performance_metrics],
+            "performance_metrics": [serialize(metric) for metric in self.result.performance_metrics],
             "integration_tests": self.result.integration_tests
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
-        
-        # 生成可读报告
-        self._generate_readable_report("/tmp/framework_assessment_report.md")
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    report_data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(report_data, f, indent=2, ensure_ascii=False)
     
-    def _generate_readable_report(self, output_file: str):
-        """生成可读的Markdown报告"""
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# 游戏服务器框架完整性评估报告\n\n")
-            f.write(f"**评估时间**: {self.result.timestamp}\n\n")
-            f.write(f"**总体得分**: {self.result.overall_score:.1f}%\n\n")
-            
-            # 模块状态
-            f.write("## 模块状态分析\n\n")
-            f.write("### 框架层模块\n\n")
-            self._write_module_table(f, self.result.framework_modules)
-            
-            f.write("\n### 业务层模块\n\n")
-            self._write_module_table(f, self.result.business_modules)
-            
-            f.write("\n### 支撑模块\n\n") 
-            self._write_module_table(f, self.result.support_modules)
-            
-            # 性能指标
-            f.write("\n## 性能基准测试\n\n")
-            f.write("| 测试项目 | 目标值 | 实际值 | 单位 | 状态 | 备注 |\n")
-            f.write("|---------|--------|--------|------|------|------|\n")
-            for metric in self.result.performance_metrics:
-                status = "✅" if metric.passed else "❌"
-                f.write(f"| {metric.test_name} | {metric.target_value} | {metric.actual_value} | {metric.unit} | {status} | {metric.details} |\n")
-            
-            # 集成测试
-            f.write("\n## 集成测试场景\n\n")
-            f.write("| 测试场景 | 状态 |\n")
-            f.write("|----------|------|\n")
-            for scenario, passed in self.result.integration_tests.items():
-                status = "✅" if passed else "❌"
-                f.write(f"| {scenario} | {status} |\n")
-            
-            # 建议
-            f.write("\n## 改进建议\n\n")
-            for i, recommendation in enumerate(self.result.recommendations, 1):
-                f.write(f"{i}. {recommendation}\n")
+    @property
+    def report_reusable(self) -> bool:
+        """评估正常完成且编译检查得到了可靠结论时，报告才可写入回放缓存"""
+        return self._assessment_completed and self._build_verified
     
-    def _write_module_table(self, f, modules_dict):
-        """写入模块状态表格"""
-        f.write("| 模块名称 | 存在 | POM | 编译 | 测试 | 覆盖率 | 问题 |\n")
-        f.write("|----------|------|-----|------|------|--------|------|\n")
+    def replay_key(self) -> Optional[str]:
+        """计算回放缓存键：git HEAD、工作区改动(不含target/)、源码指纹和工具版本，非git仓库返回None"""
+        try:
+            head = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=self.framework_root, capture_output=True, text=True, timeout=30, check=True
+            ).stdout.strip()
+            # 排除Maven构建产物，否则首次构建生成的target/会让下次运行的键不同
+            dirty = subprocess.run(
+                ["git", "status", "--porcelain", "--", ".", ":(exclude,glob)**/target/**"],
+                cwd=self.framework_root, capture_output=True, text=True, timeout=30, check=True
+            ).stdout
+        except (OSError, subprocess.SubprocessError):
+            return None
+        
+        key_source = f"{self.framework_root.resolve()}:{head}:{dirty}:{self._fingerprint()}:{TOOL_VERSION}"
+        return hashlib.blake2b(key_source.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def replay_report(self, key: str) -> bool:
+        """命中回放缓存时将缓存的报告复制到输出路径"""
+        cache_dir = os.path.join(REPLAY_CACHE_DIR, key)
+        cached_files = [(os.path.join(cache_dir, os.path.basename(path)), path)
+                        for path in (REPORT_JSON_FILE, REPORT_MD_FILE)]
+        if not all(os.path.isfile(cached) for cached, _ in cached_files):
+            return False
+        
+        # 未统计覆盖率的报告带有过期时间，过期后重新评估
+        try:
+            with open(os.path.join(cache_dir, REPLAY_EXPIRES_FILE), 'r', encoding='utf-8') as f:
+                if time.time() >= float(f.read()):
+                    return False
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            return False
+        
+        for cached, path in cached_files:
+            shutil.copyfile(cached, path)
+        logger.info(f"输入未变化，复用缓存的评估报告: {cache_dir}")
+        return True
+    
+    def store_report(self, key: str):
+        """将本次生成的报告保存到回放缓存"""
+        cache_dir = os.path.join(REPLAY_CACHE_DIR, key)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            for path in (REPORT_JSON_FILE, REPORT_MD_FILE):
+                shutil.copyfile(path, os.path.join(cache_dir, os.path.basename(path)))
+            expires_file = os.path.join(cache_dir, REPLAY_EXPIRES_FILE)
+            if self._report_ttl is None:
+                if os.path.exists(expires_file):
+                    os.remove(expires_file)
+            else:
+                with open(expires_file, 'w', encoding='utf-8') as f:
+                    f.write(str(time.time() + self._report_ttl))
+        except OSError as e:
+            logger.warning(f"写入回放缓存失败: {e}")
+    
+    def _generate_readable_report(self, out_path: str):
+        """生成可读的Markdown报告（先在内存中拼接，最后一次性写入）"""
+        parts: List[str] = []
+        parts.append("# 游戏服务器框架完整性评估报告\n\n")
+        parts.append(f"**评估时间**: {self.result.timestamp}\n\n")
+        parts.append(f"**总体得分**: {self.result.overall_score:.1f}%\n\n")
+        parts.append(f"**编译结果**: {BOOL_ICON[self.result.compilation_success]}\n\n")
+        
+        # 模块状态
+        parts.append("## 模块状态分析\n\n")
+        parts.append("### 框架层模块\n\n")
+        self._write_module_table(parts, self.result.framework_modules)
+        
+        parts.append("\n### 业务层模块\n\n")
+        self._write_module_table(parts, self.result.business_modules)
+        
+        parts.append("\n### 支撑模块\n\n")
+        self._write_module_table(parts, self.result.support_modules)
+        
+        # 性能指标
+        parts.append("\n## 性能基准测试\n\n")
+        parts.append("| 测试项目 | 目标值 | 实际值 | 单位 | 状态 | 备注 |\n")
+        parts.append("|---------|--------|--------|------|------|------|\n")
+        for metric in self.result.performance_metrics:
+            parts.append(f"| {metric.test_name} | {metric.target_value} | {metric.actual_value} | {metric.unit} | {BOOL_ICON[metric.passed]} | {metric.details} |\n")
+        
+        # 集成测试
+        parts.append("\n## 集成测试场景\n\n")
+        parts.append("| 测试场景 | 状态 |\n")
+        parts.append("|----------|------|\n")
+        for scenario, passed in self.result.integration_tests.items():
+            parts.append(f"| {scenario} | {BOOL_ICON[passed]} |\n")
+        
+        # 建议
+        parts.append("\n## 改进建议\n\n")
+        for i, recommendation in enumerate(self.result.recommendations, 1):
+            parts.append(f"{i}. {recommendation}\n")
+        
+        Path(out_path).write_text("".join(parts), encoding='utf-8')
+    
+    def _write_module_table(self, parts: List[str], modules_dict: Dict[str, ModuleStatus]):
+        """追加模块状态表格"""
+        parts.append("| 模块名称 | 存在 | POM | 编译 | 测试 | 覆盖率 | 问题 |\n")
+        parts.append("|----------|------|-----|------|------|--------|------|\n")
         
         for name, status in modules_dict.items():
-            exists = "✅" if status.exists else "❌"
-            has_pom = "✅" if status.has_pom else "❌"
-            compilable = "✅" if status.compilable else "❌"
-            has_tests = "✅" if status.has_tests else "❌"
-            coverage = f"{status.test_coverage:.1f}%"
-            issues = "; ".join(status.issues) if status.issues else "-"
-            
-            f.write(f"| {name} | {exists} | {has_pom} | {compilable} | {has_tests} | {coverage} | {issues} |\n")
+            parts.append(ROW_TMPL(
+                name,
+                BOOL_ICON[status.exists],
+                BOOL_ICON[status.has_pom],
+                BOOL_ICON[status.compilable],
+                BOOL_ICON[status.has_tests],
+                status.test_coverage,
+                "; ".join(status.issues) or "-"
+            ))
 
 def main():
     """主函数"""
-    if len(sys.argv) != 2:
-        print("用法: python framework_assessment.py <framework_root_path>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="游戏服务器框架完整性评估工具")
+    parser.add_argument("framework_root", help="框架根目录")
+    parser.add_argument("--replay", action="store_true",
+                        help="输入(git HEAD、工作区改动、源码)未变化时直接复用缓存的报告")
+    parser.add_argument("--offline", action="store_true", help="Maven以离线模式构建")
+    args = parser.parse_args()
     
-    framework_root = sys.argv[1]
+    framework_root = args.framework_root
     if not os.path.exists(framework_root):
         print(f"错误: 框架根目录不存在: {framework_root}")
         sys.exit(1)
     
+    assessment = FrameworkAssessment(framework_root, offline=args.offline)
+    
+    # 回放模式：命中缓存时直接输出历史报告
+    replay_key = assessment.replay_key() if args.replay else None
+    if replay_key and assessment.replay_report(replay_key):
+        print(f"输入未变化，已复用缓存报告: {REPORT_MD_FILE}")
+        sys.exit(0)
+    
     # 运行评估
-    assessment = FrameworkAssessment(framework_root)
     result = assessment.run_assessment()
     
     # 生成报告
     assessment.generate_report()
+    if replay_key:
+        if assessment.report_reusable:
+            assessment.store_report(replay_key)
+        else:
+            logger.warning("编译检查未得到可靠结论，本次报告不写入回放缓存")
     
     # 输出摘要
     print(f"\n{'='*60}")
     print("框架评估完成!")
     print(f"总体得分: {result.overall_score:.1f}%")
-    print(f"详细报告: /tmp/framework_assessment_report.md")
-    print(f"JSON报告: /tmp/framework_assessment_report.json")
+    print(f"详细报告: {REPORT_MD_FILE}")
+    print(f"JSON报告: {REPORT_JSON_FILE}")
     print(f"日志文件: /tmp/framework_assessment.log")
     print(f"{'='*60}")
 